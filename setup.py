@@ -42,7 +42,7 @@ if __name__ == "__main__":
             "attrs >= 20.3",
             "click >= 7.1",
             "gitpython >= 3.1",
-            "setuptools >= 49.6",
+            "importlib-metadata >= 1.0; python_version < '3.8'",
         ],
         entry_points={"console_scripts": ["metagit = metagit.__main__:main"]},
         classifiers=[
@@ -1,13 +1,38 @@
 """Define MetagitRepo and MetagitProject."""
 
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+import functools
+import os
 from pathlib import Path
-from typing import Iterator, Set, Tuple, Type, TypeVar, Union
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import attr
-import git
-from pkg_resources import get_distribution
+
+if TYPE_CHECKING:  # pragma: no cover
+    # GitPython is slow to import, so it is only imported when it is needed.
+    import git
+
+if sys.version_info >= (3, 8):
+    from importlib.metadata import PackageNotFoundError, version
+else:  # pragma: no cover
+    from importlib_metadata import PackageNotFoundError, version
 
 
 __all__ = [
@@ -22,7 +47,11 @@ __all__ = [
     "NotInRepoError",
     "UntrackedProjectError",
 ]
-__version__ = get_distribution(__name__).version
+try:
+    # pkg_resources scans every distribution on sys.path (slow), this does not.
+    __version__ = version(__name__)
+except PackageNotFoundError:  # pragma: no cover
+    __version__ = "0+unknown"
 
 
 class MetagitError(Exception):
@@ -74,30 +103,82 @@ class UntrackedProjectError(InvalidPathError):
         return super().__str__() + " is not being tracked by metagit"
 
 
-@attr.s(frozen=True)
+# Windows would otherwise translate newlines:
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _read_bytes(path: Union[str, Path]) -> bytes:
+    """Read a (small) file, bypassing BufferedReader."""
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        # Reads can be short (and files can grow), so read until EOF:
+        read = functools.partial(os.read, fd, os.fstat(fd).st_size + 1)
+        return b"".join(iter(read, b""))
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Write a (small) file, bypassing BufferedWriter."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _to_path(path: Union[str, "os.PathLike[str]"]) -> Path:
+    """Convert path to a Path (without copying one that already is)."""
+    return path if isinstance(path, Path) else Path(path)
+
+
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class _GitRepo:
 
     _git_path_attr = "path"
     _git_repo_exc = InvalidPathError
     _git_checkout_exc = InvalidPathError
 
-    def _git_checkout(self, relative_path: Union[str, Path]) -> None:
-        """Restore a file from the HEAD commit."""
-        head = self._git_repo().head
+    def _git_blob(
+        self,
+        # https://github.com/gitpython-developers/GitPython/issues/1349
+        git_repo: "git.Repo",  # type: ignore
+        relative_path: Union[str, Path],
+    ) -> "git.Blob":
+        """Look up a file in the HEAD commit of git_repo (from self._git_repo())."""
         try:
-            commit = head.commit
+            commit = git_repo.head.commit
         except ValueError as exc:
             raise self._git_checkout_exc(relative_path) from exc
         try:
             blob = commit.tree[str(relative_path)]
         except KeyError as exc:
             raise self._git_checkout_exc(relative_path) from exc
+        # Directories (containing tracked files) are trees, not blobs:
+        if blob.type != "blob":
+            raise self._git_checkout_exc(relative_path)
+        return blob
+
+    def _git_checkout(
+        self,
+        # https://github.com/gitpython-developers/GitPython/issues/1349
+        git_repo: "git.Repo",  # type: ignore
+        relative_path: Union[str, Path],
+    ) -> None:
+        """Restore a file from the HEAD commit of git_repo (from self._git_repo())."""
+        blob = self._git_blob(git_repo, relative_path)
         path = getattr(self, self._git_path_attr) / relative_path
-        blob.stream_data(path.open("wb"))
+        # stream_data() ignores short writes, so the file must be buffered:
+        with path.open("wb", buffering=65536) as file_:
+            blob.stream_data(file_)
 
     # https://github.com/gitpython-developers/GitPython/issues/1349
-    def _git_repo(self, *, init: bool = False) -> git.Repo:  # type: ignore
+    def _git_repo(self, *, init: bool = False) -> "git.Repo":  # type: ignore
         """Get a git.Repo."""
+        import git  # pylint: disable=import-outside-toplevel
+
         path = getattr(self, self._git_path_attr)
         try:
             if init:
@@ -113,11 +194,11 @@ class _GitRepo:
 _MetagitProject = TypeVar("_MetagitProject", bound="MetagitProject")
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class MetagitProject(_GitRepo):
     """Manage a Metagit Project."""
 
-    path: Path = attr.ib(converter=Path)
+    path: Path = attr.ib(converter=_to_path)
     _git_repo_exc = InvalidProjectError
 
     @classmethod
@@ -139,7 +220,7 @@ class MetagitProject(_GitRepo):
         """
         git_repo = self._git_repo()
         try:
-            return (Path(git_repo.git_dir) / "config").read_bytes()
+            return _read_bytes(Path(git_repo.git_dir) / "config")
         except FileNotFoundError:
             # git seems to be fine with a repo missing its .git/config file...
             # Call it equivalent to an empty one:
@@ -154,7 +235,7 @@ class MetagitProject(_GitRepo):
         OSError is raised if config cannot be written (e.g. due to permissions).
         """
         git_repo = self._git_repo(init=True)
-        (Path(git_repo.git_dir) / "config").write_bytes(config)
+        _write_bytes(Path(git_repo.git_dir) / "config", config)
 
     def set_remote(self, name: str, url: str) -> None:
         """
@@ -166,24 +247,104 @@ class MetagitProject(_GitRepo):
         try:
             remote = git_repo.remote(name)
         except ValueError:
-            remote = git_repo.create_remote(name, url)
-        if remote.url != url:
-            remote.set_url(url, old_url=remote.url)
+            git_repo.create_remote(name, url)
+        else:
+            # Remote attributes are looked up in the config on every access:
+            old_url = remote.url
+            if old_url != url:
+                remote.set_url(url, old_url=old_url)
+
+
+# Commits are immutable, so results are cached by SHA (new commits miss the cache):
+_TRACKED_PROJECTS: Dict[Tuple["MetagitRepo", str], FrozenSet[MetagitProject]] = {}
+_TRACKED_PROJECTS_MAXSIZE = 4
+
+
+def _tracked_projects(
+    repo: "MetagitRepo",
+    commit: "git.Commit",
+) -> FrozenSet[MetagitProject]:
+    """
+    Get the projects tracked by a commit in a Metagit repository.
+
+    The commit should come from the caller's git.Repo (so no other one is opened),
+    but only repo and commit.hexsha are used to look up cached results.
+    """
+    key = (repo, commit.hexsha)
+    with suppress(KeyError):
+        return _TRACKED_PROJECTS[key]
+    repo_path = repo.path()
+    # traverse() is typed as (maybe) yielding edges, but that only happens if as_edge.
+    blobs: Iterator[git.Blob] = commit.tree.traverse(  # type: ignore
+        predicate=lambda item, depth: item.type == "blob",  # type: ignore
+        branch_first=False,
+    )
+    projects = frozenset(MetagitProject(repo_path / blob.path) for blob in blobs)
+    if len(_TRACKED_PROJECTS) >= _TRACKED_PROJECTS_MAXSIZE:
+        # dicts are ordered, so the first key is the oldest:
+        _TRACKED_PROJECTS.pop(next(iter(_TRACKED_PROJECTS)), None)
+    _TRACKED_PROJECTS[key] = projects
+    return projects
+
+
+def _map(func: Callable[..., object], *iterables: Sequence[Any]) -> None:
+    """
+    Call func with an item from each sequence in turn (like map), discarding results.
+
+    The work is I/O-bound (the GIL is released while waiting on files and git),
+    so multiple calls are spread over threads (but never more threads than calls).
+    """
+    calls = min(len(iterable) for iterable in iterables)
+    if calls > 1:
+        max_workers = min(calls, 32, (os.cpu_count() or 1) + 4)  # executor's default
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(func, *iterables))
+    else:
+        for args in zip(*iterables):
+            func(*args)
+
+
+def _commit_message(verb: str, relative_paths: Sequence[Path]) -> str:
+    """Describe a commit that changes one or more projects."""
+    if len(relative_paths) == 1:
+        return f"{verb} {relative_paths[0]}"
+    return "\n".join(
+        [f"{verb} {len(relative_paths)} projects", ""]
+        + [str(relative_path) for relative_path in relative_paths],
+    )
 
 
 _MetagitRepo = TypeVar("_MetagitRepo", bound="MetagitRepo")
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class MetagitRepo(_GitRepo):
     """Manage a Metagit repository."""
 
     METAGIT_DIR_NAME = ".metagit"
-    metagit_dir: Path = attr.ib(converter=Path)
+    metagit_dir: Path = attr.ib(converter=_to_path)
+    _repo_path: Path = attr.ib(init=False, repr=False, eq=False)
     _git_path_attr = "metagit_dir"
     _git_repo_exc = InvalidRepoError
     _git_checkout_exc = UntrackedProjectError
 
+    @_repo_path.default
+    def _repo_path_default(self) -> Path:
+        """Compute the repo root once (see path())."""
+        return self.metagit_dir.parent
+
+    def _project_set(
+        self,
+        # https://github.com/gitpython-developers/GitPython/issues/1349
+        git_repo: "git.Repo",  # type: ignore
+    ) -> FrozenSet[MetagitProject]:
+        """Get the projects tracked by git_repo (from self._git_repo())."""
+        try:
+            commit = git_repo.head.commit
+        except ValueError:
+            return frozenset()  # no commits == no tracked projects
+        return _tracked_projects(self, commit)
+
     def _repo_relative_path(self, path: Union[str, Path]) -> Path:
         """
         Get the path to a project relative to the Metagit repository.
@@ -192,32 +353,39 @@ class MetagitRepo(_GitRepo):
         NotInRepoError is raised if path is not in self.path().
         """
         try:
-            return Path(path).resolve().relative_to(self.path())
+            return Path(path).resolve().relative_to(self._repo_path)
         except ValueError as exc:
             raise NotInRepoError(path, self) from exc
 
-    def _sync_project(self, project: MetagitProject) -> None:
+    def _sync_project(self, project: MetagitProject, relative_path: Path) -> None:
         """
         Ensure that the project path contents match the actual project config.
 
-        The project does NOT need to be tracked (so as to allow syncing pre-add).
+        The project does NOT need to be tracked (so as to allow syncing pre-add),
+        but relative_path must be its path from _repo_relative_path().
 
-        NotInRepoError is raised if a passed project is not in the repo.
         InvalidProjectError is raised if a passed project is not valid.
         InvalidRepoError is raised if self.metagit_dir does not refer to a valid repo.
 
         OSError is raised if project config cannot be read or written in .metagit.
         """
-        path = self.metagit_dir / self._repo_relative_path(project.path)
+        # This runs for every project in status(), so skip building Paths:
+        path = os.path.join(self.metagit_dir, relative_path)
         try:
             config = project.get_config()
         except InvalidProjectError:
             # project is untracked, deleted, or no longer valid.
             with suppress(FileNotFoundError):
-                path.unlink()
+                os.unlink(path)
         else:
-            path.parent.mkdir(exist_ok=True, parents=True)
-            path.write_bytes(config)
+            try:
+                synced = _read_bytes(path) == config
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                synced = False
+            if not synced:
+                # Leave unchanged files alone (which also keeps git's stat cache warm).
+                _write_bytes(path, config)
 
     def add_project(self, project: Union[str, Path, MetagitProject]) -> MetagitProject:
         """
@@ -229,18 +397,45 @@ class MetagitRepo(_GitRepo):
 
         OSError is raised if project config cannot be read or written in .metagit.
         """
-        # The project must be valid:
-        project = MetagitProject.for_path(
-            project.path if isinstance(project, MetagitProject) else project,
+        return self.add_projects(project)[0]
+
+    def add_projects(
+        self,
+        *projects: Union[str, Path, MetagitProject],
+    ) -> List[MetagitProject]:
+        """
+        Add projects to the Metagit repository (in a single commit).
+
+        Nothing is added unless every passed project can be added.
+
+        InvalidProjectError is raised if a passed project is not valid.
+        NotInRepoError is raised if a passed project is valid but not in the repo.
+        InvalidRepoError is raised if self.metagit_dir does not refer to a valid repo.
+
+        OSError is raised if project config cannot be read or written in .metagit.
+        """
+        # The projects must be valid:
+        _projects = [
+            MetagitProject.for_path(
+                project.path if isinstance(project, MetagitProject) else project,
+            )
+            for project in projects
+        ]
+        # The projects must be in the repo:
+        relative_paths = [
+            self._repo_relative_path(project.path) for project in _projects
+        ]
+        if not relative_paths:
+            return _projects
+        # Add the projects:
+        for project, relative_path in zip(_projects, relative_paths):
+            self._sync_project(project, relative_path)
+        git_repo = self._git_repo()
+        git_repo.index.add(
+            [str(self.metagit_dir / relative_path) for relative_path in relative_paths],
         )
-        # The project must be in the repo:
-        relative_path = self._repo_relative_path(project.path)
-        # Add the project:
-        self._sync_project(project)
-        repo = self._git_repo()
-        repo.index.add([str(self.metagit_dir / relative_path)])
-        repo.index.commit(f"Add {relative_path}")
-        return project
+        git_repo.index.commit(_commit_message("Add", relative_paths))
+        return _projects
 
     def diff_project(self, project: Union[str, Path, MetagitProject]) -> str:
         """
@@ -254,18 +449,18 @@ class MetagitRepo(_GitRepo):
 
         OSError is raised if project config cannot be read or written in .metagit.
         """
-        project_path = (
-            project.path if isinstance(project, MetagitProject) else Path(project)
-        )
-        project = MetagitProject(project_path.resolve())
         # The project must be in the repo:
-        relative_path = self._repo_relative_path(project.path)
+        relative_path = self._repo_relative_path(
+            project.path if isinstance(project, MetagitProject) else project,
+        )
+        project = MetagitProject(self._repo_path / relative_path)
         # The project must be tracked:
-        if project not in self.projects():
+        git_repo = self._git_repo()
+        if project not in self._project_set(git_repo):
             raise UntrackedProjectError(project.path)
         # Get a diff for the project:
-        self._sync_project(project)
-        return str(self._git_repo().git.diff("--color", "--", relative_path))
+        self._sync_project(project, relative_path)
+        return str(git_repo.git.diff("--color", "--", relative_path))
 
     @classmethod
     def for_path(
@@ -282,15 +477,16 @@ class MetagitRepo(_GitRepo):
 
         OSError is raised if path parents cannot be read.
         """
-        repo_paths = [Path(path).resolve()]
-        if search_parent_directories:
-            repo_paths.extend(repo_paths[0].parents)
-        for repo_path in repo_paths:
+        repo_path = Path(path).resolve()
+        while True:
             metagit_dir = repo_path / cls.METAGIT_DIR_NAME
-            if metagit_dir.is_dir():
+            if os.path.isdir(metagit_dir):
                 repo = cls(metagit_dir)
                 repo._git_repo()
                 return repo
+            if not search_parent_directories or repo_path.parent == repo_path:
+                break
+            repo_path = repo_path.parent
         raise (InvalidRepoPathError if search_parent_directories else InvalidRepoError)(
             path,
         )
@@ -310,7 +506,7 @@ class MetagitRepo(_GitRepo):
 
     def path(self) -> Path:
         """Get the canonical path to the repo root."""
-        return self.metagit_dir.parent
+        return self._repo_path
 
     def projects(self) -> Iterator[MetagitProject]:
         """
@@ -318,16 +514,7 @@ class MetagitRepo(_GitRepo):
 
         InvalidRepoError is raised if self.metagit_dir does not refer to a valid repo.
         """
-        repo_path = self.path()
-        head = self._git_repo().head
-        try:
-            commit = head.commit
-        except ValueError:
-            return  # no commits == no tracked projects
-        for blob_or_tree in commit.tree.traverse():
-            # https://github.com/gitpython-developers/GitPython/issues/1349
-            if isinstance(blob_or_tree, git.Blob):  # type: ignore
-                yield MetagitProject(repo_path / blob_or_tree.path)
+        yield from sorted(self._project_set(self._git_repo()))
 
     def remove_project(self, path: Union[str, Path, MetagitProject]) -> None:
         """
@@ -339,19 +526,41 @@ class MetagitRepo(_GitRepo):
 
         OSError is raised if project config cannot be read or written in .metagit.
         """
-        if isinstance(path, MetagitProject):
-            path = path.path
-        # The project must be in the repo:
-        relative_path = self._repo_relative_path(path)
-        # The project must be tracked:
-        try:
-            self._git_checkout(relative_path)
-        except self._git_checkout_exc as exc:
-            raise self._git_checkout_exc(path) from exc.__cause__
-        # Stop tracking the project:
-        repo = self._git_repo()
-        repo.index.remove([str(relative_path)], working_tree=True)
-        repo.index.commit(f"Remove {relative_path}")
+        self.remove_projects(path)
+
+    def remove_projects(self, *paths: Union[str, Path, MetagitProject]) -> None:
+        """
+        Remove projects from the Metagit repository (in a single commit).
+
+        Nothing is removed unless every passed project can be removed.
+
+        NotInRepoError is raised if a path is not in the repo.
+        InvalidRepoError is raised if self.metagit_dir does not refer to a valid repo.
+        UntrackedProjectError is raised if a passed project is not being tracked.
+
+        OSError is raised if project config cannot be read or written in .metagit.
+        """
+        _paths = [
+            path.path if isinstance(path, MetagitProject) else path for path in paths
+        ]
+        # The projects must be in the repo:
+        relative_paths = [self._repo_relative_path(path) for path in _paths]
+        if not relative_paths:
+            return
+        # The projects must be tracked:
+        git_repo = self._git_repo()
+        for path, relative_path in zip(_paths, relative_paths):
+            try:
+                self._git_blob(git_repo, relative_path)
+            except self._git_checkout_exc as exc:
+                raise self._git_checkout_exc(path) from exc.__cause__
+        # Stop tracking the projects (even if they were changed or deleted):
+        git_repo.index.remove(
+            [str(relative_path) for relative_path in relative_paths],
+            working_tree=True,
+            f=True,
+        )
+        git_repo.index.commit(_commit_message("Remove", relative_paths))
 
     def restore_project(self, path: Union[str, Path, MetagitProject]) -> MetagitProject:
         """
@@ -369,11 +578,11 @@ class MetagitRepo(_GitRepo):
         relative_path = self._repo_relative_path(path)
         # The project must be tracked:
         try:
-            self._git_checkout(relative_path)
+            self._git_checkout(self._git_repo(), relative_path)
         except self._git_checkout_exc as exc:
             raise self._git_checkout_exc(path) from exc.__cause__
         # Restore the project:
-        project = MetagitProject(self.path() / relative_path)
+        project = MetagitProject(self._repo_path / relative_path)
         project.set_config((self.metagit_dir / relative_path).read_bytes())
         return project
 
@@ -389,14 +598,15 @@ class MetagitRepo(_GitRepo):
 
         OSError is raised if project config cannot be read in .metagit.
         """
-        repo_path = self.path()
+        repo_path = self._repo_path
         git_repo = self._git_repo()
         try:
             tree = git_repo.head.commit.tree
         except ValueError:
             tree = {}
-        untracked = set()
+        untracked: Set[Path] = set()
         projects = set()
+        tracked = self._project_set(git_repo)
 
         for path in paths or [repo_path]:
             # The path must be in the repo:
@@ -406,7 +616,7 @@ class MetagitRepo(_GitRepo):
             path = repo_path / relative_path
 
             projects_in_path = set()
-            for project in self.projects():
+            for project in tracked:
                 try:
                     path.relative_to(project.path)
                 except ValueError:
@@ -426,26 +636,59 @@ class MetagitRepo(_GitRepo):
             else:
                 if projects_in_path or path == repo_path:
                     projects.update(projects_in_path)
-                    for subpath in path.iterdir():
-                        if (
-                            subpath.name not in tree
+                    # Tree membership tests are linear, so hash the names once:
+                    tracked_names = {
+                        entry.name
+                        for entry in (
+                            tree
                             if path == repo_path
-                            else tree[str(relative_path)]
-                        ):
-                            untracked.add(path / subpath)
+                            else tree[relative_path.as_posix()]
+                        )
+                    }
+                    with os.scandir(path) as entries:
+                        untracked.update(
+                            Path(entry.path)
+                            for entry in entries
+                            if entry.name not in tracked_names
+                        )
                 elif path.exists():
                     untracked.add(path)
                 # If it doesn't exist, ignore it.
 
+        # Tracked project paths are already resolved:
+        relative_paths = {
+            project: project.path.relative_to(repo_path) for project in projects
+        }
+        _map(
+            self._sync_project,
+            list(relative_paths.keys()),
+            list(relative_paths.values()),
+        )
+        projects_by_path = {
+            relative_path.as_posix(): project
+            for project, relative_path in relative_paths.items()
+        }
+
         deleted, modified = set(), set()
-        for project in projects:
-            self._sync_project(project)
-            path = self.metagit_dir / project.path.relative_to(repo_path)
-            if not path.exists():
-                deleted.add(project)
-            elif git_repo.is_dirty(path=path):
-                modified.add(project)
-            # The project is clean.
+        if projects_by_path:
+            # One `git status` is much cheaper than `git diff`s for every project.
+            status: str = git_repo.git.status(
+                "--porcelain",
+                "-z",
+                "--no-renames",
+                "--untracked-files=no",
+            )
+            # Unlisted projects are clean.
+            for entry in filter(None, status.split("\0")):
+                project_path = entry[3:]  # entry is "XY path"
+                changed = projects_by_path.get(project_path)
+                if changed is None:
+                    # e.g. a project that wasn't asked about, or a non-project file
+                    continue
+                if (self.metagit_dir / project_path).exists():
+                    modified.add(changed)
+                else:
+                    deleted.add(changed)
 
         return deleted, modified, untracked
 
@@ -466,18 +709,28 @@ class MetagitRepo(_GitRepo):
                 project.path if isinstance(project, MetagitProject) else project,
             )
             # The project must be tracked:
-            if _project not in self.projects():
+            if _project not in tracked:
                 raise UntrackedProjectError(project)
             return _project
 
-        remotes = self._git_repo().remotes
-        for project in [
-            validated_project(project)
-            for project in projects
-            if project is not None  # for backwards-compatibility
-        ] or self.projects():
-            for remote in remotes:
-                project.set_remote(
-                    remote.name,
-                    project.path.name.join(remote.url.rsplit(self.METAGIT_DIR_NAME, 1)),
-                )
+        def sync_project(project: MetagitProject) -> None:
+            for name, url_parts in remote_url_parts:
+                project.set_remote(name, project.path.name.join(url_parts))
+
+        git_repo = self._git_repo()
+        # GitPython's Remote objects are not thread-safe, so read them up front:
+        remote_url_parts = [
+            (remote.name, remote.url.rsplit(self.METAGIT_DIR_NAME, 1))
+            for remote in git_repo.remotes
+        ]
+        tracked = self._project_set(git_repo)
+        # Concurrent syncs of one project (e.g. passed as p and p/.git) would conflict:
+        _projects = list(
+            dict.fromkeys(
+                validated_project(project)
+                for project in projects
+                if project is not None  # for backwards-compatibility
+            ),
+        ) or sorted(tracked)
+        # Each project is a separate repo, so they can be synced concurrently:
+        _map(sync_project, _projects)
@@ -1,15 +1,40 @@
 """Create and manage a Metagit repository on the command line."""
 
 
-import contextlib
+from operator import attrgetter
 import os
-from typing import cast, Iterator, Tuple, Type, Union
+from types import TracebackType
+from typing import cast, Optional, Tuple, Type, Union
 
 import click
 
 import metagit
 
 
+class _DebugManager:
+    """Raise expected exceptions if --debug is passed, otherwise print and fail."""
+
+    # A plain class is cheaper than @contextlib.contextmanager, and it is reusable.
+    __slots__ = ("ctx", "exc_types")
+
+    def __init__(self, ctx: click.Context, *exc_types: Type[Exception]) -> None:
+        self.ctx = ctx
+        self.exc_types = exc_types
+
+    def __enter__(self) -> None:
+        """Start handling expected exceptions."""
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Fail (unless --debug was passed) if an expected exception was raised."""
+        if isinstance(exc, self.exc_types) and not self.ctx.obj["debug"]:
+            self.ctx.fail(str(exc))
+
+
 @click.group(no_args_is_help=True)
 @click.option("--debug/--no-debug", help="Enable debug output.", default=False)
 @click.option(
@@ -28,20 +53,9 @@ import metagit
 @click.pass_context
 def main(ctx: click.Context, debug: bool, path: str) -> None:
     """Manage a Metagit repository."""
-
-    @contextlib.contextmanager
-    def debug_manager(*exc_types: Type[Exception]) -> Iterator[None]:
-        """Raise expected exceptions if --debug is passed, otherwise print and fail."""
-        try:
-            yield
-        except exc_types as exc:
-            if ctx.obj["debug"]:
-                raise
-            ctx.fail(str(exc))
-
     ctx.obj = {
         "debug": debug,
-        "manager": debug_manager(metagit.MetagitError),
+        "manager": _DebugManager(ctx, metagit.MetagitError),
         "path": path,
     }
 
@@ -81,8 +95,7 @@ def add(ctx: click.Context, path: Tuple[str]) -> None:
             ctx.obj["path"],
             search_parent_directories=True,
         )
-        for p in path:
-            repo.add_project(p)
+        repo.add_projects(*path)
 
 
 @main.command()
@@ -95,8 +108,7 @@ def rm(ctx: click.Context, path: Tuple[str]) -> None:
             ctx.obj["path"],
             search_parent_directories=True,
         )
-        for p in path:
-            repo.remove_project(p)
+        repo.remove_projects(*path)
 
 
 @main.command()
@@ -142,18 +154,19 @@ def status(ctx: click.Context, path: Tuple[str, ...]) -> None:
             ctx.obj["path"],
             search_parent_directories=True,
         )
-        projects = repo.projects()
         deleted, modified, untracked = repo.status(*path)
+        # Changed projects are tracked, so only look further if there are none:
+        tracking = bool(deleted or modified) or any(repo.projects())
     if deleted or modified:
         click.echo("Changes")
         click.echo('  (use "metagit add/rm <project>..." to accept changes)')
         click.echo('  (use "metagit restore <project>..." to undo changes)')
-        for project in sorted(deleted.union(modified)):
+        for project in sorted(deleted | modified, key=attrgetter("path")):
             prefix = "deleted:  " if project in deleted else "modified: "
             relpath = os.path.relpath(project.path, start=ctx.obj["path"])
             click.secho(f"\t{prefix}{relpath}", fg="red")
         click.echo()
-    elif not any(projects):
+    elif not tracking:
         click.echo("No projects are being tracked yet")
         click.echo()
     if untracked:
@@ -2,41 +2,76 @@
 
 
 from pathlib import Path
+import shutil
 import uuid
 
+from click.testing import CliRunner
 import git
 import pytest
-from pytest_lazyfixture import lazy_fixture
 
 import metagit
 
 from util import git_repo_for_metagit_repo
 
 
-@pytest.fixture(params=[True, False])
-def empty_repo(request, tmp_path_factory):
-    """Get an empty MetagitRepo."""
+def _copy_repo(template, tmp_path_factory):
+    """Copy a MetagitRepo (built once per session) into a new directory."""
+    repo_path = tmp_path_factory.mktemp(template.path().name) / "projects"
+    shutil.copytree(template.path(), repo_path)
+    return metagit.MetagitRepo(repo_path / metagit.MetagitRepo.METAGIT_DIR_NAME)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Get a CliRunner (which has no per-invocation state)."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def removed_empty_repo_template(tmp_path_factory):
+    """Get an empty MetagitRepo in which .metagit was removed."""
+    repo = metagit.MetagitRepo.init(tmp_path_factory.mktemp("empty_projects"))
+    repo.remove_project(repo.metagit_dir)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def uncommitted_empty_repo_template(tmp_path_factory):
+    """Get an empty MetagitRepo in which .metagit was never committed."""
     repo_path = tmp_path_factory.mktemp("empty_projects")
-    if request.param:
-        # .metagit was removed.
-        repo = metagit.MetagitRepo.init(repo_path)
-        repo.remove_project(repo.metagit_dir)
-    else:
-        # .metagit was never committed.
-        repo = metagit.MetagitRepo(repo_path / metagit.MetagitRepo.METAGIT_DIR_NAME)
-        git.Repo.init(repo.metagit_dir)
+    repo = metagit.MetagitRepo(repo_path / metagit.MetagitRepo.METAGIT_DIR_NAME)
+    git.Repo.init(repo.metagit_dir)
     return repo
 
 
-@pytest.fixture
-def nonempty_repo(tmp_path_factory):
-    """Get a MetagitRepo that tracks at least one project (in addition to .metagit)."""
+@pytest.fixture(scope="session")
+def nonempty_repo_template(tmp_path_factory):
+    """Get a MetagitRepo that tracks projects (in addition to .metagit)."""
     repo = metagit.MetagitRepo.init(tmp_path_factory.mktemp("nonempty_projects"))
-    for _ in range(5):
-        repo.add_project(git_repo_for_metagit_repo(repo).git_dir)
+    repo.add_projects(*[git_repo_for_metagit_repo(repo).git_dir for _ in range(5)])
     return repo
 
 
+@pytest.fixture(
+    params=["removed_empty_repo_template", "uncommitted_empty_repo_template"],
+)
+def empty_repo(request, tmp_path_factory):
+    """Get an empty MetagitRepo."""
+    return _copy_repo(request.getfixturevalue(request.param), tmp_path_factory)
+
+
+@pytest.fixture
+def nonempty_repo(nonempty_repo_template, tmp_path_factory):
+    """Get a MetagitRepo that tracks at least one project (in addition to .metagit)."""
+    return _copy_repo(nonempty_repo_template, tmp_path_factory)
+
+
+@pytest.fixture
+def first_project(nonempty_repo):
+    """Get the first project tracked by nonempty_repo."""
+    return next(nonempty_repo.projects())
+
+
 @pytest.fixture(params=[str, Path])
 def path_type(request):
     """Get all valid types of path."""
@@ -57,10 +92,16 @@ def project_type(request):
     return request.param
 
 
-@pytest.fixture(params=[lazy_fixture("empty_repo"), lazy_fixture("nonempty_repo")])
-def repo(request):
+@pytest.fixture(
+    params=[
+        "removed_empty_repo_template",
+        "uncommitted_empty_repo_template",
+        "nonempty_repo_template",
+    ],
+)
+def repo(request, tmp_path_factory):
     """Get a MetagitRepo."""
-    return request.param
+    return _copy_repo(request.getfixturevalue(request.param), tmp_path_factory)
 
 
 @pytest.fixture(
@@ -2,7 +2,7 @@
 
 
 import os
-from pathlib import Path
+import re
 
 import git
 import pytest
@@ -10,6 +10,7 @@ import pytest
 import metagit as api
 
 from util import (
+    append_remote,
     git_repo_for_metagit_repo,
     non_metagit_dir_project,
     project_remotes,
@@ -55,19 +56,19 @@ def test_project_for_path_absolute(project, path_type):
     "child",
     [
         # nonproject, nonexistent:
-        Path("/tmp") / "nonexistent" / "subdir",
+        "../nonexistent/subdir",
         # nonproject, exists:
-        Path("/tmp"),
+        "..",
         # project, nonexistent:
-        Path(".git") / "nonexistent" / "subdir",
+        ".git/nonexistent/subdir",
         # project, exists:
-        Path(".git") / "config",
+        ".git/config",
     ],
 )
 def test_project_for_path_absolute_fail(project, child, path_type):
     """MetagitProject.for_path fails on absolute, non-project paths."""
     path = project.path / child
-    with pytest.raises(api.InvalidProjectError, match=str(path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(path))):
         api.MetagitProject.for_path(path_type(path))
 
 
@@ -83,13 +84,13 @@ def test_project_for_path_relative(project, monkeypatch, tmp_path, path_type):
     "child",
     [
         # nonproject, nonexistent:
-        Path("/tmp") / "nonexistent" / "subdir",
+        "../nonexistent/subdir",
         # nonproject, exists:
-        Path("/tmp"),
+        "..",
         # project, nonexistent:
-        Path(".git") / "nonexistent" / "subdir",
+        ".git/nonexistent/subdir",
         # project, exists:
-        Path(".git") / "config",
+        ".git/config",
     ],
 )
 def test_project_for_path_relative_fail(
@@ -102,7 +103,7 @@ def test_project_for_path_relative_fail(
     """MetagitProject.for_path fails on relative, non-project paths."""
     monkeypatch.chdir(tmp_path)
     path = os.path.relpath(project.path / child)
-    with pytest.raises(api.InvalidProjectError, match=str(path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(path))):
         api.MetagitProject.for_path(path_type(path))
 
 
@@ -114,14 +115,14 @@ def test_project_get_config_empty(project):
 
 def test_project_get_config_invalid(tmp_path):
     """MetagitProject.get_config raises an exception for invalid projects."""
-    with pytest.raises(api.InvalidProjectError, match=str(tmp_path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(tmp_path))):
         api.MetagitProject(tmp_path).get_config()
 
 
 def test_project_get_config_remote(project):
     """MetagitProject.get_config results change if a remote is added to the project."""
     config = project.get_config()
-    git.Repo(project.path).create_remote("test_project_get_config_remote", "a@b.c:d")
+    append_remote(project.path, "test_project_get_config_remote")
     assert config != project.get_config()
 
 
@@ -142,7 +143,7 @@ def test_project_set_config_fail(project):
     """MetagitProject.set_config raises an appropriate exception on failure."""
     rm_rf(project.path)
     project.path.mkdir(0o555)
-    with pytest.raises(api.InvalidProjectError, match=str(project.path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(project.path))):
         project.set_config(b"")
 
 
@@ -155,14 +156,14 @@ def test_repo_add_project_invalid_repo(tmp_path, project_type):
     """MetagitRepo.add_project raises an exception if the repo is not valid."""
     repo = api.MetagitRepo(tmp_path / api.MetagitRepo.METAGIT_DIR_NAME)
     git_repo = git_repo_for_metagit_repo(repo)
-    with pytest.raises(api.InvalidRepoError, match=str(repo.metagit_dir)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(repo.metagit_dir))):
         repo.add_project(project_type(git_repo.git_dir))
 
 
 def test_repo_add_project_nonexistent(repo, project_type):
     """MetagitRepo.add_project raises an exception if the path does not exist."""
     path = repo.path() / "nonexistent"
-    with pytest.raises(api.InvalidProjectError, match=str(path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(path))):
         repo.add_project(project_type(path))
 
 
@@ -170,43 +171,76 @@ def test_repo_add_project_nongit(repo, project_type):
     """MetagitRepo.add_project raises an exception if the path is not a git repo."""
     path = repo.path() / "nongit"
     path.mkdir()
-    with pytest.raises(api.InvalidProjectError, match=str(path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(path))):
         repo.add_project(project_type(path))
 
 
-def test_repo_add_project_not_in_repo(empty_repo, nonempty_repo, project_type):
+def test_repo_add_project_not_in_repo(
+    empty_repo,
+    nonempty_repo,
+    first_project,
+    project_type,
+):
     """MetagitRepo.add_project raises an exception if the path is not in the repo."""
-    path = next(nonempty_repo.projects()).path
-    with pytest.raises(api.NotInRepoError, match=str(path)):
+    path = first_project.path
+    with pytest.raises(api.NotInRepoError, match=re.escape(str(path))):
         empty_repo.add_project(project_type(path))
 
 
-def test_repo_diff_project(nonempty_repo, project_type):
+def test_repo_add_project_symlink_changed(nonempty_repo, project):
+    """MetagitRepo.add_project resolves symlinks created after earlier calls."""
+    link = nonempty_repo.path() / "link"
+    assert not any(nonempty_repo.status(link))
+    link.symlink_to(project.path, target_is_directory=True)
+    with pytest.raises(api.NotInRepoError, match=re.escape(str(link))):
+        nonempty_repo.add_project(link)
+
+
+def test_repo_add_projects(nonempty_repo, project_type):
+    """MetagitRepo.add_projects tracks several projects in a single commit."""
+    git_repos = [git_repo_for_metagit_repo(nonempty_repo) for _ in range(3)]
+    head = git.Repo(nonempty_repo.metagit_dir).head
+    commit = head.commit
+    projects = nonempty_repo.add_projects(
+        *[project_type(git_repo.git_dir) for git_repo in git_repos],
+    )
+    assert head.commit.parents == (commit,)
+    assert set(projects) <= set(nonempty_repo.projects())
+
+
+def test_repo_add_projects_none(nonempty_repo):
+    """MetagitRepo.add_projects does not commit if no projects are passed."""
+    head = git.Repo(nonempty_repo.metagit_dir).head
+    commit = head.commit
+    assert nonempty_repo.add_projects() == []
+    assert head.commit == commit
+
+
+def test_repo_diff_project(nonempty_repo, first_project, project_type):
     """MetagitRepo.diff_project returns an empty string if the project is clean."""
     assert "" == nonempty_repo.diff_project(
-        project_type(next(nonempty_repo.projects()).path),
+        project_type(first_project.path),
     )
 
 
-def test_repo_diff_project_changed(nonempty_repo, project_type):
+def test_repo_diff_project_changed(nonempty_repo, first_project, project_type):
     """MetagitRepo.diff_project returns an empty string if the project is clean."""
-    project = next(nonempty_repo.projects())
-    git.Repo(project.path).create_remote("test_repo_diff_project_changed", "a@b.c:d")
-    assert nonempty_repo.diff_project(project_type(project.path)) != ""
+    append_remote(first_project.path, "test_repo_diff_project_changed")
+    assert nonempty_repo.diff_project(project_type(first_project.path)) != ""
 
 
 def test_repo_diff_project_invalid_repo(tmp_path, project_type):
     """MetagitRepo.diff_project raises an exception if the repo is not valid."""
     repo = api.MetagitRepo(tmp_path / api.MetagitRepo.METAGIT_DIR_NAME)
     git_repo = git_repo_for_metagit_repo(repo)
-    with pytest.raises(api.InvalidRepoError, match=str(tmp_path)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(tmp_path))):
         repo.diff_project(project_type(git_repo.git_dir))
 
 
 def test_repo_diff_project_nonexistent(repo, project_type):
     """MetagitRepo.diff_project raises an exception for a nonexistent project."""
     path = repo.path() / "nonexistent"
-    with pytest.raises(api.UntrackedProjectError, match=str(path)):
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(str(path))):
         repo.diff_project(project_type(path))
 
 
@@ -215,21 +249,21 @@ def test_repo_diff_project_not_in_repo(repo, tmp_path, project_type):
     git_repo = git_repo_for_metagit_repo(
         api.MetagitRepo(tmp_path / api.MetagitRepo.METAGIT_DIR_NAME),
     )
-    with pytest.raises(api.NotInRepoError, match=str(tmp_path)):
+    with pytest.raises(api.NotInRepoError, match=re.escape(str(tmp_path))):
         repo.diff_project(project_type(git_repo.git_dir))
 
 
-def test_repo_diff_project_relative(nonempty_repo, project_type):
+def test_repo_diff_project_relative(nonempty_repo, first_project, project_type):
     """MetagitRepo.diff_project works on relative paths."""
-    project = next(nonempty_repo.projects())
-    git.Repo(project.path).create_remote("test_repo_diff_project_changed", "a@b.c:d")
-    assert nonempty_repo.diff_project(project_type(os.path.relpath(project.path))) != ""
+    append_remote(first_project.path, "test_repo_diff_project_changed")
+    path = os.path.relpath(first_project.path)
+    assert nonempty_repo.diff_project(project_type(path)) != ""
 
 
 def test_repo_diff_project_untracked(repo, tmp_path, project_type):
     """MetagitRepo.diff_project raises an exception for an untracked project."""
     git_repo = git_repo_for_metagit_repo(repo)
-    with pytest.raises(api.UntrackedProjectError, match=git_repo.git_dir):
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(git_repo.git_dir)):
         repo.diff_project(project_type(git_repo.git_dir))
 
 
@@ -261,7 +295,7 @@ def test_repo_for_path_not_in_repo(
 ):
     """MetagitRepo.for_path raises an exception for paths not in a repo."""
     path = tmp_path_factory.mktemp("projects")
-    with pytest.raises(api.InvalidRepoError, match=str(path)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(path))):
         api.MetagitRepo.for_path(
             path_type(path),
             search_parent_directories=search_parent_directories,
@@ -271,7 +305,7 @@ def test_repo_for_path_not_in_repo(
 def test_repo_for_path_search_parent_directories(repo, path_type):
     """MetagitRepo.for_path finds repos in parent directories when requested."""
     child_path = repo.path() / "child"
-    with pytest.raises(api.InvalidRepoError, match=str(child_path)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(child_path))):
         api.MetagitRepo.for_path(
             path_type(child_path),
             search_parent_directories=False,
@@ -284,7 +318,7 @@ def test_repo_for_path_search_parent_directories(repo, path_type):
 
 def test_repo_for_path_search_parent_directories_fail(tmp_path, path_type):
     """MetagitRepo.for_path raises an exception if no parents are a valid repo."""
-    with pytest.raises(api.InvalidRepoPathError, match=str(tmp_path)):
+    with pytest.raises(api.InvalidRepoPathError, match=re.escape(str(tmp_path))):
         api.MetagitRepo.for_path(path_type(tmp_path), search_parent_directories=True)
 
 
@@ -315,7 +349,7 @@ def test_repo_init_fail(monkeypatch, tmp_path_factory, path_type):
         tmp_path_factory.mktemp("test_repo_init_fail")
         / api.MetagitRepo.METAGIT_DIR_NAME
     )
-    with pytest.raises(api.InvalidRepoError, match=str(path)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(path))):
         api.MetagitRepo.init(path_type(path))
 
 
@@ -327,7 +361,7 @@ def test_repo_init_nonexistent(tmp_path, path_type):
 def test_repo_projects_corrupt(repo):
     """MetagitRepo.projects raises InvalidRepoError if the metagit_dir is corrupt."""
     rm_rf(repo.metagit_dir / ".git")
-    with pytest.raises(api.InvalidRepoError, match=str(repo.metagit_dir)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(repo.metagit_dir))):
         any(repo.projects())
 
 
@@ -355,18 +389,17 @@ def test_repo_projects_relative(repo):
     assert all(project.path.relative_to(repo.path()) for project in repo.projects())
 
 
-def test_repo_remove_project_absolute(nonempty_repo, project_type):
+def test_repo_remove_project_absolute(nonempty_repo, first_project, project_type):
     """MetagitRepo.remove_project untracks a valid project with an absolute path."""
-    project = next(nonempty_repo.projects())
-    nonempty_repo.remove_project(project_type(project.path))
-    assert project not in nonempty_repo.projects()
+    nonempty_repo.remove_project(project_type(first_project.path))
+    assert first_project not in nonempty_repo.projects()
 
 
 def test_repo_remove_project_invalid_repo(tmp_path, project_type):
     """MetagitRepo.remove_project raises an exception if the repo is invalid."""
     repo = api.MetagitRepo(tmp_path / api.MetagitRepo.METAGIT_DIR_NAME)
     git_repo = git_repo_for_metagit_repo(repo)
-    with pytest.raises(api.InvalidRepoError, match=str(repo.metagit_dir)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(repo.metagit_dir))):
         repo.remove_project(project_type(git_repo.git_dir))
 
 
@@ -387,39 +420,76 @@ def test_repo_remove_project_nongit(nonempty_repo, project_type):
     assert project not in nonempty_repo.projects()
 
 
-def test_repo_remove_project_not_in_repo(empty_repo, nonempty_repo, project_type):
+def test_repo_remove_project_not_in_repo(
+    empty_repo,
+    nonempty_repo,
+    first_project,
+    project_type,
+):
     """MetagitRepo.remove_project raises an exception if the path isn't in the repo."""
-    path = next(nonempty_repo.projects()).path
-    with pytest.raises(api.NotInRepoError, match=str(path)):
+    path = first_project.path
+    with pytest.raises(api.NotInRepoError, match=re.escape(str(path))):
         empty_repo.remove_project(project_type(path))
 
 
-def test_repo_remove_project_relative(nonempty_repo, project_type):
+def test_repo_remove_project_relative(nonempty_repo, first_project, project_type):
     """MetagitRepo.remove_project untracks a valid project with a cwd-relative path."""
-    project = next(nonempty_repo.projects())
-    nonempty_repo.remove_project(project_type(os.path.relpath(project.path)))
-    assert project not in nonempty_repo.projects()
+    nonempty_repo.remove_project(project_type(os.path.relpath(first_project.path)))
+    assert first_project not in nonempty_repo.projects()
 
 
 def test_repo_remove_project_untracked(repo, project_type):
     """MetagitRepo.remove_project raises an exception if the path is not tracked."""
     dir_path = repo.path() / "untracked_dir"
     dir_path.mkdir()
-    with pytest.raises(api.UntrackedProjectError, match=str(dir_path)):
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(str(dir_path))):
         repo.remove_project(project_type(dir_path))
 
 
-def test_repo_restore_project(nonempty_repo, project_type):
+def test_repo_remove_project_parent(nonempty_repo, path_type):
+    """MetagitRepo.remove_project raises an exception for a project's parent."""
+    path = nonempty_repo.path() / "parent"
+    nonempty_repo.add_project(git.Repo.init(path / "child").git_dir)
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(str(path))):
+        nonempty_repo.remove_project(path_type(path))
+
+
+def test_repo_remove_projects(nonempty_repo, project_type):
+    """MetagitRepo.remove_projects untracks several projects in a single commit."""
+    projects = list(nonempty_repo.projects())[:3]
+    head = git.Repo(nonempty_repo.metagit_dir).head
+    commit = head.commit
+    nonempty_repo.remove_projects(*[project_type(project.path) for project in projects])
+    assert head.commit.parents == (commit,)
+    assert not set(projects) & set(nonempty_repo.projects())
+
+
+def test_repo_remove_projects_none(nonempty_repo):
+    """MetagitRepo.remove_projects does not commit if no projects are passed."""
+    head = git.Repo(nonempty_repo.metagit_dir).head
+    commit = head.commit
+    nonempty_repo.remove_projects()
+    assert head.commit == commit
+
+
+def test_repo_restore_project(nonempty_repo, first_project, project_type):
     """MetagitRepo.restore_project overwrites un-added changes."""
-    project = next(nonempty_repo.projects())
-    git_repo = git.Repo(project.path)
+    git_repo = git.Repo(first_project.path)
     remote_name = "test_repo_restore_project"
-    git_repo.create_remote(remote_name, "a@b.c:d")
+    append_remote(first_project.path, remote_name)
     assert remote_name in git_repo.remotes
-    nonempty_repo.restore_project(project_type(project.path))
+    nonempty_repo.restore_project(project_type(first_project.path))
     assert remote_name not in git_repo.remotes
 
 
+def test_repo_restore_project_parent(nonempty_repo, path_type):
+    """MetagitRepo.restore_project raises an exception for a project's parent."""
+    path = nonempty_repo.path() / "parent"
+    nonempty_repo.add_project(git.Repo.init(path / "child").git_dir)
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(str(path))):
+        nonempty_repo.restore_project(path_type(path))
+
+
 def test_repo_restore_project_deleted(nonempty_repo, project_type):
     """MetagitRepo.restore_project re-creates deleted projects."""
     project = non_metagit_dir_project(nonempty_repo)
@@ -433,21 +503,26 @@ def test_repo_restore_project_invalid_repo(tmp_path, project_type):
     """MetagitRepo.restore_project raises an exception if the repo is invalid."""
     repo = api.MetagitRepo(tmp_path / api.MetagitRepo.METAGIT_DIR_NAME)
     git_repo = git_repo_for_metagit_repo(repo)
-    with pytest.raises(api.InvalidRepoError, match=str(repo.metagit_dir)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(repo.metagit_dir))):
         repo.restore_project(project_type(git_repo.git_dir))
 
 
-def test_repo_restore_project_not_in_repo(empty_repo, nonempty_repo, project_type):
+def test_repo_restore_project_not_in_repo(
+    empty_repo,
+    nonempty_repo,
+    first_project,
+    project_type,
+):
     """MetagitRepo.restore_project raises an exception if the path isn't in the repo."""
-    path = next(nonempty_repo.projects()).path
-    with pytest.raises(api.NotInRepoError, match=str(path)):
+    path = first_project.path
+    with pytest.raises(api.NotInRepoError, match=re.escape(str(path))):
         empty_repo.restore_project(project_type(path))
 
 
 def test_repo_restore_untracked(empty_repo, project_type):
     """MetagitRepo.restore_project does NOT overwrite changes to untracked projects."""
     git_repo = git_repo_for_metagit_repo(empty_repo)
-    with pytest.raises(api.UntrackedProjectError, match=git_repo.git_dir):
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(git_repo.git_dir)):
         empty_repo.restore_project(project_type(git_repo.git_dir))
 
 
@@ -503,16 +578,14 @@ def test_repo_status_deleted_nongit(nonempty_repo):
     assert not untracked
 
 
-def test_repo_status_deleted_nongit_config(nonempty_repo, tmp_path):
+def test_repo_status_deleted_nongit_config(nonempty_repo):
     """MetagitRepo.status discovers non-Git projects that have a .git/config."""
     project = non_metagit_dir_project(nonempty_repo)
-    git_dir = Path(git.Repo(project.path).git_dir)
-    tmp_config = tmp_path / "config"
-    git_dir_config = git_dir / "config"
-    os.link(git_dir_config, tmp_config)
+    git_dir = project.path / ".git"
+    config = (git_dir / "config").read_bytes()
     rm_rf(git_dir)
     git_dir.mkdir()
-    tmp_config.rename(git_dir_config)
+    (git_dir / "config").write_bytes(config)
     deleted, modified, untracked = nonempty_repo.status()
     assert project in deleted
     assert len(deleted) == 1
@@ -523,39 +596,52 @@ def test_repo_status_deleted_nongit_config(nonempty_repo, tmp_path):
 def test_repo_status_invalid_repo(tmp_path):
     """MetagitRepo.status raises an exception if the repo is invalid."""
     repo = api.MetagitRepo(tmp_path / api.MetagitRepo.METAGIT_DIR_NAME)
-    with pytest.raises(api.InvalidRepoError, match=str(repo.metagit_dir)):
+    with pytest.raises(api.InvalidRepoError, match=re.escape(str(repo.metagit_dir))):
         repo.status()
 
 
-def test_repo_status_modified(nonempty_repo):
+def test_repo_status_modified(nonempty_repo, first_project):
     """MetagitRepo.status discovers projects that have been modified."""
-    project = next(nonempty_repo.projects())
-    git.Repo(project.path).create_remote("test_repo_status_modified", "a@b.c:d")
+    append_remote(first_project.path, "test_repo_status_modified")
     deleted, modified, untracked = nonempty_repo.status()
     assert not deleted
-    assert project in modified
+    assert first_project in modified
     assert len(modified) == 1
     assert not untracked
 
 
-def test_repo_status_modified_path(nonempty_repo, project_type):
+def test_repo_status_modified_path(nonempty_repo, first_project, project_type):
     """MetagitRepo.status discovers projects that have been modified by path."""
-    project = next(nonempty_repo.projects())
-    git.Repo(project.path).create_remote("test_repo_status_modified", "a@b.c:d")
-    deleted, modified, untracked = nonempty_repo.status(project_type(project.path))
+    append_remote(first_project.path, "test_repo_status_modified")
+    deleted, modified, untracked = nonempty_repo.status(
+        project_type(first_project.path),
+    )
     assert not deleted
-    assert project in modified
+    assert first_project in modified
     assert len(modified) == 1
     assert not untracked
 
 
-def test_repo_status_modified_no_config(nonempty_repo):
+def test_repo_status_modified_other_path(nonempty_repo, project_type):
+    """MetagitRepo.status ignores modified projects outside of the passed paths."""
+    projects = sorted(nonempty_repo.projects())
+    append_remote(projects[0].path, "test_repo_status_modified_other_path")
+    assert not any(nonempty_repo.status(project_type(projects[-1].path)))
+
+
+def test_repo_status_nonproject_change(nonempty_repo):
+    """MetagitRepo.status ignores changes to files in .metagit that aren't projects."""
+    (nonempty_repo.metagit_dir / "README").write_text("not a project")
+    nonempty_repo._git_repo().index.add(["README"])
+    assert not any(nonempty_repo.status())
+
+
+def test_repo_status_modified_no_config(nonempty_repo, first_project):
     """MetagitRepo.status discovers projects that have no config file."""
-    project = next(nonempty_repo.projects())
-    (Path(git.Repo(project.path).git_dir) / "config").unlink()
+    (first_project.path / ".git" / "config").unlink()
     deleted, modified, untracked = nonempty_repo.status()
     assert not deleted
-    assert project in modified
+    assert first_project in modified
     assert len(modified) == 1
     assert not untracked
 
@@ -571,6 +657,12 @@ def test_repo_status_no_commits(empty_repo):
     assert len(untracked) == 1
 
 
+def test_repo_status_parent(nonempty_repo, project_type):
+    """MetagitRepo.status does not report tracked projects under a path as untracked."""
+    project = non_metagit_dir_project(nonempty_repo)
+    assert not any(nonempty_repo.status(project_type(project.path.parent)))
+
+
 def test_repo_status_untracked(empty_repo):
     """MetagitRepo.status discovers untracked paths in the repo."""
     deleted, modified, untracked = empty_repo.status()
@@ -628,15 +720,27 @@ def test_repo_sync_remotes_project(repo_with_remote):
             assert project_remotes(project).get(name) != project_url
 
 
+def test_repo_sync_remotes_duplicates(nonempty_repo):
+    """MetagitRepo.sync_remotes syncs a project passed more than once (by any path)."""
+    project = non_metagit_dir_project(nonempty_repo)
+    name, url_template = "SomeRemoteName", "git@github.com:SomeName/{0}.git"
+    nonempty_repo._git_repo().create_remote(
+        name,
+        url_template.format(nonempty_repo.METAGIT_DIR_NAME),
+    )
+    nonempty_repo.sync_remotes(*[project.path, project.path / ".git"] * 8)
+    assert project_remotes(project) == {name: url_template.format(project.path.name)}
+
+
 def test_repo_sync_remotes_nonexistent(repo, project_type):
     """MetagitRepo.sync_remotes raises an exception for a nonexistent project."""
     path = repo.path() / "nonexistent"
-    with pytest.raises(api.InvalidProjectError, match=str(path)):
+    with pytest.raises(api.InvalidProjectError, match=re.escape(str(path))):
         repo.sync_remotes(project_type(path))
 
 
 def test_repo_sync_remotes_untracked(repo, tmp_path, project_type):
     """MetagitRepo.sync_remotes raises an exception for an untracked project."""
     git_repo = git_repo_for_metagit_repo(repo)
-    with pytest.raises(api.UntrackedProjectError, match=git_repo.git_dir):
+    with pytest.raises(api.UntrackedProjectError, match=re.escape(git_repo.git_dir)):
         repo.sync_remotes(project_type(git_repo.git_dir))
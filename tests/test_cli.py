@@ -3,10 +3,10 @@
 
 import os.path
 from pathlib import Path
-import subprocess
+import runpy
 import sys
 
-from click.testing import CliRunner
+import pytest
 
 from metagit import __version__, MetagitError, MetagitProject, MetagitRepo
 from metagit import __main__ as cli
@@ -23,15 +23,18 @@ from util import (
 # pylint: disable=no-value-for-parameter
 
 
-def test_python_m():
+def test_python_m(monkeypatch):
     """Test python -m."""
-    command = [sys.executable, "-m", "metagit"]
-    assert subprocess.run(command, check=False).returncode == 0
+    monkeypatch.setattr(sys, "argv", ["metagit"])
+    # runpy warns if the module to run as __main__ was already imported:
+    monkeypatch.delitem(sys.modules, "metagit.__main__")
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("metagit", run_name="__main__")
+    assert exc_info.value.code == 0
 
 
-def test_main():
+def test_main(runner):
     """Test invocation with no arguments matches --help."""
-    runner = CliRunner()
     no_args_result = runner.invoke(cli.main, [])
     assert no_args_result.exit_code == 0
     help_result = runner.invoke(cli.main, ["--help"])
@@ -39,9 +42,8 @@ def test_main():
     assert no_args_result.output == help_result.output
 
 
-def test_main_debug():
+def test_main_debug(runner):
     """`metagit --debug` shows tracebacks instead of failing gracefully."""
-    runner = CliRunner()
     with runner.isolated_filesystem():
         result = runner.invoke(cli.main, ["--no-debug", "status"])
         assert result.exit_code != 0
@@ -51,9 +53,8 @@ def test_main_debug():
         assert isinstance(result.exception, MetagitError)
 
 
-def test_main_path(nonempty_repo):
+def test_main_path(runner, nonempty_repo):
     """`metagit -C` changes the repo path."""
-    runner = CliRunner()
     with runner.isolated_filesystem():
         result = runner.invoke(cli.main, ["status"])
         assert result.exit_code != 0
@@ -63,17 +64,15 @@ def test_main_path(nonempty_repo):
         assert result.output == ""
 
 
-def test_main_version():
+def test_main_version(runner):
     """Test --version."""
-    runner = CliRunner()
     result = runner.invoke(cli.main, ["--version"])
     assert result.exit_code == 0
     assert __version__ in result.output
 
 
-def test_init():
+def test_init(runner):
     """`metagit init` creates a new repo."""
-    runner = CliRunner()
     with runner.isolated_filesystem():
         metagit_dir = Path(MetagitRepo.METAGIT_DIR_NAME).resolve()
         assert not metagit_dir.exists()
@@ -83,66 +82,56 @@ def test_init():
         assert metagit_dir.is_dir(), result.output
 
 
-def test_add(repo):
+def test_add(runner, repo):
     """`metagit add` tracks a project."""
-    runner = CliRunner()
+    git_repo = git_repo_for_metagit_repo(repo)
+    project = MetagitProject.for_path(git_repo.git_dir)
+    assert project not in repo.projects()
+    result = runner.invoke(cli.main, ["-C", repo.path(), "add", git_repo.git_dir])
+    assert result.exit_code == 0
+    assert result.output == ""
+    assert project in repo.projects()
+
+
+def test_add_relative(runner, repo):
+    """`metagit add` tracks a project specified by relative path."""
+    git_repo = git_repo_for_metagit_repo(repo)
+    project = MetagitProject.for_path(git_repo.git_dir)
+    assert project not in repo.projects()
     with runner.isolated_filesystem():
-        git_repo = git_repo_for_metagit_repo(repo)
-        project = MetagitProject.for_path(git_repo.git_dir)
-        assert project not in repo.projects()
-        result = runner.invoke(cli.main, ["-C", repo.path(), "add", git_repo.git_dir])
+        result = runner.invoke(
+            cli.main,
+            ["-C", repo.path(), "add", os.path.relpath(git_repo.git_dir)],
+        )
         assert result.exit_code == 0
         assert result.output == ""
-        assert project in repo.projects()
+    assert project in repo.projects()
 
 
-def test_add_relative(repo):
-    """`metagit add` tracks a project specified by relative path."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        git_repo = git_repo_for_metagit_repo(repo)
-        project = MetagitProject.for_path(git_repo.git_dir)
-        assert project not in repo.projects()
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                cli.main,
-                ["-C", repo.path(), "add", os.path.relpath(git_repo.git_dir)],
-            )
-            assert result.exit_code == 0
-            assert result.output == ""
-        assert project in repo.projects()
-
-
-def test_rm(nonempty_repo):
+def test_rm(runner, nonempty_repo, first_project):
     """`metagit rm` untracks a project."""
-    runner = CliRunner()
+    result = runner.invoke(
+        cli.main,
+        ["-C", nonempty_repo.path(), "rm", str(first_project.path)],
+    )
+    assert result.exit_code == 0
+    assert result.output == ""
+    assert first_project not in nonempty_repo.projects()
+
+
+def test_rm_relative(runner, nonempty_repo, first_project):
+    """`metagit rm` untracks a project specified by relative path."""
     with runner.isolated_filesystem():
-        project = next(nonempty_repo.projects())
         result = runner.invoke(
             cli.main,
-            ["-C", nonempty_repo.path(), "rm", str(project.path)],
+            ["-C", nonempty_repo.path(), "rm", os.path.relpath(first_project.path)],
         )
         assert result.exit_code == 0
         assert result.output == ""
-        assert project not in nonempty_repo.projects()
+    assert first_project not in nonempty_repo.projects()
 
 
-def test_rm_relative(nonempty_repo):
-    """`metagit rm` untracks a project specified by relative path."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        project = next(nonempty_repo.projects())
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                cli.main,
-                ["-C", nonempty_repo.path(), "rm", os.path.relpath(project.path)],
-            )
-            assert result.exit_code == 0
-            assert result.output == ""
-        assert project not in nonempty_repo.projects()
-
-
-def test_remote_sync(repo_with_remote):
+def test_remote_sync(runner, repo_with_remote):
     """`metagit remote-sync` translates .metagit remotes to each tracked project."""
     repo, (name, url_template) = repo_with_remote
 
@@ -151,20 +140,18 @@ def test_remote_sync(repo_with_remote):
             project_url = url_template.format(project.path.name)
             assert project_remotes(project).get(name) != project_url
 
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            cli.main,
-            ["-C", repo.path(), "remote-sync"],
-        )
-        assert result.exit_code == 0
-        assert result.output == ""
-        for project in repo.projects():
-            project_url = url_template.format(project.path.name)
-            assert project_remotes(project).get(name) == project_url
+    result = runner.invoke(
+        cli.main,
+        ["-C", repo.path(), "remote-sync"],
+    )
+    assert result.exit_code == 0
+    assert result.output == ""
+    for project in repo.projects():
+        project_url = url_template.format(project.path.name)
+        assert project_remotes(project).get(name) == project_url
 
 
-def test_remote_sync_project(repo_with_remote):
+def test_remote_sync_project(runner, repo_with_remote):
     """`metagit remote-sync` translates .metagit remotes to a tracked project."""
     repo, (name, url_template) = repo_with_remote
 
@@ -175,154 +162,132 @@ def test_remote_sync_project(repo_with_remote):
             assert project_remotes(project).get(name) != project_url
     _project = project
 
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            cli.main,
-            ["-C", repo.path(), "remote-sync"]
-            + ([] if _project is None else [str(_project.path)]),
-        )
-        assert result.exit_code == 0
-        assert result.output == ""
-        for project in repo.projects():
-            project_url = url_template.format(project.path.name)
-            if project == _project or project.path.name == repo.METAGIT_DIR_NAME:
-                assert project_remotes(project).get(name) == project_url
-            else:
-                assert project_remotes(project).get(name) != project_url
+    result = runner.invoke(
+        cli.main,
+        ["-C", repo.path(), "remote-sync"]
+        + ([] if _project is None else [str(_project.path)]),
+    )
+    assert result.exit_code == 0
+    assert result.output == ""
+    for project in repo.projects():
+        project_url = url_template.format(project.path.name)
+        if project == _project or project.path.name == repo.METAGIT_DIR_NAME:
+            assert project_remotes(project).get(name) == project_url
+        else:
+            assert project_remotes(project).get(name) != project_url
 
 
-def test_restore(nonempty_repo):
+def test_restore(runner, nonempty_repo):
     """`metagit restore` overwrites un-added changes to a project."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        project = non_metagit_dir_project(nonempty_repo)
-        rm_rf(project.path)
-        assert nonempty_repo.diff_project(project)
-        result = runner.invoke(
-            cli.main,
-            ["-C", nonempty_repo.path(), "restore", str(project.path)],
-        )
-        assert result.exit_code == 0
-        assert result.output == ""
-        assert not nonempty_repo.diff_project(project)
+    project = non_metagit_dir_project(nonempty_repo)
+    rm_rf(project.path)
+    assert nonempty_repo.diff_project(project)
+    result = runner.invoke(
+        cli.main,
+        ["-C", nonempty_repo.path(), "restore", str(project.path)],
+    )
+    assert result.exit_code == 0
+    assert result.output == ""
+    assert not nonempty_repo.diff_project(project)
 
 
-def test_restore_all(nonempty_repo):
+def test_restore_all(runner, nonempty_repo):
     """`metagit restore --all` restores all projects without specifying paths."""
-    runner = CliRunner()
+    project = non_metagit_dir_project(nonempty_repo)
+    rm_rf(project.path)
+    assert nonempty_repo.diff_project(project)
+    result = runner.invoke(
+        cli.main,
+        ["-C", nonempty_repo.path(), "restore", "--all"],
+    )
+    assert result.exit_code == 0
+    assert result.output == ""
+    assert not nonempty_repo.diff_project(project)
+
+
+def test_restore_relative(runner, nonempty_repo):
+    """`metagit restore` restores a project specified by relative path."""
+    project = non_metagit_dir_project(nonempty_repo)
+    rm_rf(project.path)
+    assert nonempty_repo.diff_project(project)
     with runner.isolated_filesystem():
-        project = non_metagit_dir_project(nonempty_repo)
-        rm_rf(project.path)
-        assert nonempty_repo.diff_project(project)
         result = runner.invoke(
             cli.main,
-            ["-C", nonempty_repo.path(), "restore", "--all"],
+            ["-C", nonempty_repo.path(), "restore", os.path.relpath(project.path)],
         )
         assert result.exit_code == 0
         assert result.output == ""
-        assert not nonempty_repo.diff_project(project)
+    assert not nonempty_repo.diff_project(project)
 
 
-def test_restore_relative(nonempty_repo):
-    """`metagit restore` restores a project specified by relative path."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        project = non_metagit_dir_project(nonempty_repo)
-        rm_rf(project.path)
-        assert nonempty_repo.diff_project(project)
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                cli.main,
-                ["-C", nonempty_repo.path(), "restore", os.path.relpath(project.path)],
-            )
-            assert result.exit_code == 0
-            assert result.output == ""
-        assert not nonempty_repo.diff_project(project)
-
-
-def test_diff_clean(repo):
+def test_diff_clean(runner, repo):
     """`metagit diff` produces no output in a clean repository."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli.main, ["-C", repo.path(), "diff"])
-        assert result.exit_code == 0
+    result = runner.invoke(cli.main, ["-C", repo.path(), "diff"])
+    assert result.exit_code == 0
 
 
-def test_diff_dirty(nonempty_repo):
+def test_diff_dirty(runner, nonempty_repo):
     """`metagit diff` produces output in a dirty repository."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        repo_path = nonempty_repo.path()
-        project = non_metagit_dir_project(nonempty_repo)
-        rm_rf(project.path)
-        result = runner.invoke(cli.main, ["-C", repo_path, "diff"])
-        assert result.exit_code == 0
-        assert project.path.name in result.output
+    repo_path = nonempty_repo.path()
+    project = non_metagit_dir_project(nonempty_repo)
+    rm_rf(project.path)
+    result = runner.invoke(cli.main, ["-C", repo_path, "diff"])
+    assert result.exit_code == 0
+    assert project.path.name in result.output
 
 
-def test_status_clean_empty(empty_repo):
+def test_status_clean_empty(runner, empty_repo):
     """`metagit status` produces output in a clean, empty repository."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli.main, ["-C", empty_repo.path(), "status"])
-        assert result.exit_code == 0
-        assert "No projects" in result.output
-        assert "Changes" not in result.output
-        assert "Untracked" in result.output
-        assert MetagitRepo.METAGIT_DIR_NAME in result.output
+    result = runner.invoke(cli.main, ["-C", empty_repo.path(), "status"])
+    assert result.exit_code == 0
+    assert "No projects" in result.output
+    assert "Changes" not in result.output
+    assert "Untracked" in result.output
+    assert MetagitRepo.METAGIT_DIR_NAME in result.output
 
 
-def test_status_clean(nonempty_repo):
+def test_status_clean(runner, nonempty_repo):
     """`metagit status` produces no output in a clean, nonempty repository."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli.main, ["-C", nonempty_repo.path(), "status"])
-        assert result.exit_code == 0
-        assert result.output == ""
+    result = runner.invoke(cli.main, ["-C", nonempty_repo.path(), "status"])
+    assert result.exit_code == 0
+    assert result.output == ""
 
 
-def test_status_deleted(nonempty_repo):
+def test_status_deleted(runner, nonempty_repo):
     """`metagit status` produces output if a project has been deleted."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        repo_path = nonempty_repo.path()
-        project = non_metagit_dir_project(nonempty_repo)
-        rm_rf(project.path)
-        result = runner.invoke(cli.main, ["-C", repo_path, "status"])
-        assert result.exit_code == 0
-        assert "Changes" in result.output
-        assert "deleted" in result.output
-        assert project.path.name in result.output
-        assert "modified" not in result.output
-        assert "Untracked" not in result.output
+    repo_path = nonempty_repo.path()
+    project = non_metagit_dir_project(nonempty_repo)
+    rm_rf(project.path)
+    result = runner.invoke(cli.main, ["-C", repo_path, "status"])
+    assert result.exit_code == 0
+    assert "Changes" in result.output
+    assert "deleted" in result.output
+    assert project.path.name in result.output
+    assert "modified" not in result.output
+    assert "Untracked" not in result.output
 
 
-def test_status_modified(nonempty_repo):
+def test_status_modified(runner, nonempty_repo):
     """`metagit status` produces output if a project has been modified."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        repo_path = nonempty_repo.path()
-        project = non_metagit_dir_project(nonempty_repo)
-        rm_rf(project.path / ".git" / "config")
-        result = runner.invoke(cli.main, ["-C", repo_path, "status"])
-        assert result.exit_code == 0
-        assert "Changes" in result.output
-        assert "deleted" not in result.output
-        assert "modified" in result.output
-        assert project.path.name in result.output
-        assert "Untracked" not in result.output
+    repo_path = nonempty_repo.path()
+    project = non_metagit_dir_project(nonempty_repo)
+    rm_rf(project.path / ".git" / "config")
+    result = runner.invoke(cli.main, ["-C", repo_path, "status"])
+    assert result.exit_code == 0
+    assert "Changes" in result.output
+    assert "deleted" not in result.output
+    assert "modified" in result.output
+    assert project.path.name in result.output
+    assert "Untracked" not in result.output
 
 
-def test_status_untracked(repo):
+def test_status_untracked(runner, repo):
     """`metagit status` produces output if there is an untracked project."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        git_repo = git_repo_for_metagit_repo(repo)
-        result = runner.invoke(cli.main, ["-C", repo.path(), "status"])
-        assert result.exit_code == 0
-        assert "Changes" not in result.output
-        assert "Untracked" in result.output
-        assert any(
-            str(parent) in result.output for parent in Path(git_repo.git_dir).parents
-        )
+    git_repo = git_repo_for_metagit_repo(repo)
+    result = runner.invoke(cli.main, ["-C", repo.path(), "status"])
+    assert result.exit_code == 0
+    assert "Changes" not in result.output
+    assert "Untracked" in result.output
+    assert any(
+        str(parent) in result.output for parent in Path(git_repo.git_dir).parents
+    )
@@ -1,9 +1,14 @@
 """This module contains utility functions for the tests."""
 
 
+import os
 from pathlib import Path
 import random
-from typing import Dict, Union
+import shutil
+import stat
+import sys
+from types import TracebackType
+from typing import Callable, Dict, Tuple, Type, Union
 import uuid
 
 import git
@@ -11,21 +16,32 @@ import git
 import metagit
 
 
+def append_remote(path: Union[str, Path], name: str, url: str = "a@b.c:d") -> None:
+    """Add a remote to a project by writing its config (without running git)."""
+    with open(Path(path, ".git", "config"), "a", encoding="utf-8") as config:
+        config.write(f'[remote "{name}"]\n\turl = {url}\n')
+
+
 def git_repo_for_metagit_repo(repo: metagit.MetagitRepo) -> git.Repo:
     """Get a git.Repo that can be added to a Metagit repository."""
-    project_path = repo.path()
-    for _ in range(1, random.randint(2, 5)):
-        project_path /= str(uuid.uuid4())
-    return git.Repo.init(project_path)
+    depth = random.randint(1, 4)
+    # Get randomness for every path component at once (uuid4 reads it per-call):
+    random_bytes = os.urandom(16 * depth)
+    names = [
+        uuid.UUID(bytes=random_bytes[i : i + 16], version=4).hex
+        for i in range(0, 16 * depth, 16)
+    ]
+    # git init creates any missing parent directories:
+    return git.Repo.init(os.path.join(repo.path(), *names))
 
 
 def non_metagit_dir_project(repo: metagit.MetagitRepo) -> metagit.MetagitProject:
     """Get a MetagitProject that can be deleted."""
-    projects = repo.projects()
-    project = next(projects)
-    if project.path.name == metagit.MetagitRepo.METAGIT_DIR_NAME:
-        project = next(projects)
-    return project
+    return next(
+        project
+        for project in repo.projects()
+        if project.path.name != metagit.MetagitRepo.METAGIT_DIR_NAME
+    )
 
 
 def project_remotes(project: metagit.MetagitProject) -> Dict[str, str]:
@@ -33,12 +49,31 @@ def project_remotes(project: metagit.MetagitProject) -> Dict[str, str]:
     return {remote.name: remote.url for remote in project._git_repo().remotes}
 
 
+def _chmod_and_retry(
+    func: Callable[..., object],
+    path: str,
+    exc: Union[BaseException, Tuple[Type[BaseException], BaseException, TracebackType]],
+) -> None:
+    """Make a path writable and try to remove it again (e.g. read-only git objects)."""
+    if func not in (os.unlink, os.remove, os.rmdir):
+        # e.g. os.scandir or os.open (retrying would not help), so fail as usual:
+        raise exc[1] if isinstance(exc, tuple) else exc
+    os.chmod(path, stat.S_IRWXU)
+    func(path)
+
+
 def rm_rf(path: Union[str, Path]) -> None:
     """Recursively remove a path."""
-    path = Path(path)
-    try:
-        path.unlink()
-    except IsADirectoryError:
-        for child in path.iterdir():
-            rm_rf(child)
-        path.rmdir()
+    path = os.fspath(path)
+    # lstat() (unlike is_symlink() and is_file()) answers in a single system call:
+    if stat.S_ISDIR(os.lstat(path).st_mode):
+        # onerror (which gets sys.exc_info() rather than the exception) is deprecated:
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=_chmod_and_retry)
+        else:
+            shutil.rmtree(path, onerror=_chmod_and_retry)
+    else:
+        try:
+            os.unlink(path)
+        except PermissionError as exc:
+            _chmod_and_retry(os.unlink, path, exc)